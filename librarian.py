@@ -1,26 +1,51 @@
 from __future__ import annotations
 
+import builtins
 from abc import abstractmethod, abstractstaticmethod
 from dataclasses import dataclass, field
-from enum import Enum
-from functools import singledispatch
+from enum import IntEnum
+from importlib import import_module
+from itertools import chain, count
 from json import dumps
-from os import getcwd, listdir, mkdir, walk
+from os import getcwd, listdir, mkdir, replace, scandir, stat
 from os.path import abspath, expanduser, join
+from pickle import HIGHEST_PROTOCOL
 from pickle import dump as pickle_dump
 from pickle import load as pickle_load
-from typing import Callable, List, Union, final, overload
+from sys import stdout
+from tomllib import load as toml_load
+from tomllib import loads as toml_loads
+from typing import TYPE_CHECKING, Callable, List, Union, final, overload
 
 from click import Context, argument, command, group, option, pass_context
-from flask import Flask, render_template
-from flask_cors import CORS
-from requests import Request
-from rich import print
-from rich.prompt import Confirm
-from toml import dump as toml_dump
-from toml import load as toml_load
+from tomli_w import dump as toml_dump
 from typing_extensions import override
 
+if TYPE_CHECKING:
+    from requests import Request
+
+
+def _rich_or_plain() -> Callable:
+    """Pick the print implementation for this run.
+
+    Rich markup is only worth parsing when a human terminal renders it; for
+        piped and CI output the builtin print is returned and rich itself is
+        never imported.
+
+    Return:
+        print (Callable): Either rich.print or the builtin
+    """
+
+    if not stdout.isatty():
+        return builtins.print
+
+    from rich import print as rich_print
+
+    return rich_print
+
+
+print = _rich_or_plain()
+
 # ================================= CONSTANTS =============================== #
 
 CACHE_FOLDERS = [
@@ -31,6 +56,18 @@ CACHE_FOLDERS = [
     ".pytest_cache",
 ]
 
+_CACHE_SET = frozenset(CACHE_FOLDERS)
+
+# Cache dirs matched by suffix: egg-info dirs are named <pkg>.egg-info, the
+# literal name never appears on disk
+_CACHE_SUFFIXES = (".egg-info",)
+
+# Resolved once per process, expanduser hits the environment every call
+_DEFAULT_HOME = join(expanduser("~"), ".librarian")
+
+# Metadata every registered plugin entry must carry, queries answer from it
+_PLUGIN_META_KEYS = frozenset({"language_name", "file_extensions", "project_files"})
+
 
 # =================================== RUNTIME =============================== #
 
@@ -57,17 +94,22 @@ class AppConfig:
     verbose: bool = field()
 
     def __post_init__(self):
+        # Well-known paths are derived once, nothing else should re-join them
+        self.plugins_dir = abspath(join(self.home_dir, "plugins"))
+        self.resources_toml = abspath(join(self.home_dir, "resources.toml"))
+        self.resources_cache = abspath(join(self.home_dir, "resources.cache"))
+
         if self.ignore_compromised:
             print("[yellow bold blink][!] Enabled unsecure methods!")
 
-        if self.ignore_compromised and self.verbose:
-            print("[dim][VERBOSE][bold yellow] Recommendation:")
-            for line in [
-                "We not recommend to turn off all security checks during runtime!",
-                "Run with this mode only if You really checked all dependencies and",
-                "really sure that all is ok!",
-            ]:
-                print(f"[dim][VERBOSE]\t{line}")
+            if self.verbose:
+                print("[dim][VERBOSE][bold yellow] Recommendation:")
+                for line in (
+                    "We not recommend to turn off all security checks during runtime!",
+                    "Run with this mode only if You really checked all dependencies and",
+                    "really sure that all is ok!",
+                ):
+                    print("[dim][VERBOSE]\t", line)
 
 
 APP_CONFIG: AppConfig
@@ -81,12 +123,13 @@ class AppResources:
         the list of plugins itself.
 
     Attributes:
-        languages (List[LanguageSpecs]): All languages that supported at start
+        languages (dict): Registry of all plugins, name to path on disk
         plugin_vendor (List[Vendor]): Vendors that provide plugins for styling
             and etc.
 
     Methods:
         is_language_exists (bool): Check if language added to resources
+        get_language (LanguageSpecs): Load and return single language specs
         get_all_languages (List[str]): Return list of all languages
         get_all_file_extensions (List[str]): Return list of all file extensions
             that might be found.
@@ -96,30 +139,49 @@ class AppResources:
     Version: 0.0.1
     """
 
-    _languages: List[LanguageSpecs] = []
-    _plugin_vendor: List[Vendor] = []
+    __slots__ = (
+        "_languages",
+        "_metadata",
+        "_loaded",
+        "_names_lc",
+        "_name_set",
+        "_ext_cache",
+        "_files_cache",
+        "_plugin_vendor",
+    )
 
     def __init__(self, data: dict) -> None:
         global APP_CONFIG
 
+        self._plugin_vendor: List[Vendor] = []
+
+        # Only metadata is registered here, pickles are loaded lazily on the
+        # first access of the concrete language
+        self._languages: dict[str, str] = {}
+        self._metadata: dict[str, dict] = {}
+        self._loaded: dict[str, LanguageSpecs] = {}
+        self._names_lc: List[str] = []
+
+        # Query caches, built on first use and dropped on plugin mutation
+        self._name_set: Union[frozenset, None] = None
+        self._ext_cache: Union[frozenset, None] = None
+        self._files_cache: Union[frozenset, None] = None
+
         if len(data["plugins"]) == 0:
             return
 
-        # Plugin loaded from existing resources
+        # One scandir up front: plugin presence becomes a set membership test
+        # instead of a raised-and-caught FileNotFoundError per plugin
+        try:
+            existing = {entry.name for entry in scandir(APP_CONFIG.plugins_dir)}
+
+        except FileNotFoundError:
+            existing = set()
+
         for plugin in data["plugins"]:
-            try:
-                if APP_CONFIG.verbose:
-                    print(f"[dim][VERBOSE] Loading plugin {plugin['name']}")
-                    print(f"[dim][VERBOSE]\t Version: {plugin['version']}")
-                    print(f"[dim][VERBOSE]\t Vendor: {plugin['vendor']}")
-                    print(f"[dim][VERBOSE]\t Timestamp: {plugin['timestamp']}")
-
-                with open(join(APP_CONFIG.home_dir, "plugins", plugin["name"] + ".obj"), "rb") as file:
-                    object: LanguageSpecs = pickle_load(file)
-                    self._languages.append(object)
-
-            except FileNotFoundError:
-                data.pop(plugin)
+            # Entries written under the old schema miss the metadata keys the
+            # query caches answer from — damaged just like a missing manifest
+            if plugin["name"] + ".toml" not in existing or not _PLUGIN_META_KEYS <= plugin.keys():
                 print(f"[bold red]Damaged plugin: {plugin['name']}")
                 print(f"[bold red blink] PLUGIN IS DAMAGED!")
 
@@ -127,11 +189,80 @@ class AppResources:
                     install(f"{plugin['vendor']}:{plugin['name']}")
                     continue
 
+                from rich.prompt import Confirm
+
                 if Confirm.ask("Reinstall plugin?"):
                     install(f"{plugin['vendor']}:{plugin['name']}")
                     continue
 
                 print("[bold red blink] PLUGIN DELETED AND NOT LOADED! CONTINUE!")
+                continue
+
+            if APP_CONFIG.verbose:
+                print("[dim][VERBOSE] Registering plugin", plugin["name"])
+                print("[dim][VERBOSE]\t Version:", plugin["version"])
+                print("[dim][VERBOSE]\t Vendor:", plugin["vendor"])
+                print("[dim][VERBOSE]\t Timestamp:", plugin["timestamp"])
+
+            self._languages[plugin["name"]] = f"{APP_CONFIG.plugins_dir}/{plugin['name']}.toml"
+            self._metadata[plugin["name"]] = plugin
+            self._names_lc.append(plugin["language_name"].lower())
+
+    def get_language(self, name: str) -> LanguageSpecs:
+        """Load language specs of single plugin, on demand.
+
+        Manifest read from disk happens here and only here, on first request
+            of the concrete language. Result kept in memory for next calls.
+            Damaged plugins are weeded out at registration, so only loadable
+            names ever reach this point.
+
+        Arguments:
+            name (str): Plugin name as registered in resources
+
+        Return:
+            specs (LanguageSpecs): Loaded specs of the plugin
+        """
+
+        if name in self._loaded:
+            return self._loaded[name]
+
+        with open(self._languages[name], "rb") as file:
+            object: LanguageSpecs = LanguageSpecs.from_manifest(toml_load(file))
+            self._loaded[name] = object
+            return object
+
+    def load_all_languages(self) -> List[LanguageSpecs]:
+        """Load every registered plugin in one batch.
+
+        All manifest files are read back-to-back first and parsed afterwards,
+            so the disk sees one burst of sequential reads instead of a
+            read-parse-read-parse interleaving per plugin.
+
+        Return:
+            languages (List[LanguageSpecs]): All language specs that loaded
+        """
+
+        sizes: dict[str, int] = {}
+        for name, path in self._languages.items():
+            if name not in self._loaded:
+                sizes[name] = stat(path).st_size
+
+        # One contiguous buffer holds every manifest instead of a fresh bytes
+        # object per file; each plugin gets a zero-copy window into it
+        buffer = memoryview(bytearray(sum(sizes.values())))
+        views: dict[str, memoryview] = {}
+        offset = 0
+        for name, size in sizes.items():
+            with open(self._languages[name], "rb") as file:
+                file.readinto(buffer[offset : offset + size])
+
+            views[name] = buffer[offset : offset + size]
+            offset += size
+
+        for name, view in views.items():
+            self._loaded[name] = LanguageSpecs.from_manifest(toml_loads(bytes(view).decode("utf-8")))
+
+        return list(self._loaded.values())
 
     def is_language_exists(self, lang: str) -> bool:
         """Check if language exists and returns this status
@@ -143,7 +274,10 @@ class AppResources:
             status (bool): Found or not
         """
 
-        return lang in self.get_all_languages()
+        if self._name_set is None:
+            self._name_set = frozenset(self.get_all_languages())
+
+        return lang in self._name_set
 
     def get_all_languages(self) -> List[str]:
         """Get all languages that registered in root folder.
@@ -152,99 +286,83 @@ class AppResources:
             languages (List[str]): List of all languages in lowercase.
         """
 
-        return [lang.language_name.lower() for lang in self._languages]
+        return list(self._names_lc)
 
-    def get_all_file_extensions(self) -> List[str]:
+    def get_all_file_extensions(self) -> frozenset:
         """Return all file extensions that were added during runtime.
 
         Return:
-            extensions (List(str)): List of all file extensions after period
+            extensions (frozenset): All file extensions after period
         """
 
-        result: List[str] = []
-        for lang in self._languages:
-            result.extend(lang.file_extensions)
+        if self._ext_cache is None:
+            extensions = chain.from_iterable(meta["file_extensions"] for meta in self._metadata.values())
+            self._ext_cache = frozenset(extensions)
 
-        return result
+        return self._ext_cache
 
-    def get_all_project_files(self) -> List[str]:
+    def get_all_project_files(self) -> frozenset:
         """Get files, that marks that directory is a project.
 
         Return:
-            files (List[str]): All files that related to the project.
+            files (frozenset): All files that related to the project.
         """
 
-        result: List[str] = []
-        for lang in self._languages:
-            result.extend(lang.project_files)
+        if self._files_cache is None:
+            files = chain.from_iterable(meta["project_files"] for meta in self._metadata.values())
+            self._files_cache = frozenset(files)
 
-        return result
+        return self._files_cache
 
+    def _invalidate_caches(self) -> None:
+        """Drop query caches, must be called after any plugin mutation."""
 
-APP_RESOURCES: AppResources
+        self._name_set = None
+        self._ext_cache = None
+        self._files_cache = None
 
-# ============================= EXACT DATA TYPES ============================ #
 
+APP_RESOURCES: AppResources
 
-_documentCellTypeRaw = ["paragraph", "link_text", "link_external", "table", "code", "image", "field"]
-_documentCellTypeRaw.extend([f"header_{x}" for x in range(1, 11)])
-DocumentCellType = Enum("DocumentCellType", _documentCellTypeRaw)
+# ============================= EXACT DATA TYPES ============================ #
 
 
-_ID_COUNTER: int = 0
+class DocumentCellType(IntEnum):
+    paragraph = 1
+    link_text = 2
+    link_external = 3
+    table = 4
+    code = 5
+    image = 6
+    field = 7
+    header_1 = 8
+    header_2 = 9
+    header_3 = 10
+    header_4 = 11
+    header_5 = 12
+    header_6 = 13
+    header_7 = 14
+    header_8 = 15
+    header_9 = 16
+    header_10 = 17
 
 
-def _id_generator() -> int:
-    global _ID_COUNTER
-    _ID_COUNTER += 1
-    return _ID_COUNTER
+_id_generator = count(1).__next__
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentCell:
     raw_content: str = field()
-    additional_content: dict = field(default_factory=lambda: {})
     id: int = field(default_factory=_id_generator)
     type: DocumentCellType = field(default=DocumentCellType.paragraph)  # This will make it more adaptive
 
-    def __post_init__(self) -> None:  # Adaptation goes here
-        global APP_CONFIG
-
-        if self.type == DocumentCellType.field:
-            if "name" not in self.additional_content.keys() or "label" not in self.additional_content.keys():
-                raise ValueError(self.additional_content, self.id, "Fields must contain name and text label")
-
-        if self.type in [DocumentCellType.link_text, DocumentCellType.link_external]:
-            if "target" not in self.additional_content.keys():
-                raise ValueError(self.additional_content, self.id, "Links must contain target information!")
-
-        if self.type == DocumentCellType.link_external:
-            if not self.additional_content["target"].startswith("https") and not APP_CONFIG.force_install:
-                raise ValueError(self.additional_content, self.id, "External links must contain https schema")
-
-        if self.type == DocumentCellType.code:
-            if "lang" not in self.additional_content.keys():
-                raise ValueError(
-                    self.additional_content, self.id, "Code sections must contain language, at least empty key"
-                )
-
-        if self.type == DocumentCellType.image:
-            if "src" not in self.additional_content.keys():
-                raise ValueError(
-                    self.additional_content, self.id, "Images must contain link to source, at least network"
-                )
-
     @staticmethod
-    def create_paragraph(text: str, centralized: bool = False) -> DocumentCell:
-        return DocumentCell(text, additional_content={"centralize": centralized})
+    def create_paragraph(text: str, centralized: bool = False) -> ParagraphCell:
+        return ParagraphCell(text, centralize=centralized)
 
     @staticmethod
-    def create_text_link(text: str, to: str, as_class: bool = False, as_text: bool = False) -> DocumentCell:
-        return DocumentCell(
-            text,
-            additional_content={"to": to, "as_class": as_class, "as_text": as_text},
-            type=DocumentCellType.link_text,
-        )
+    def create_text_link(text: str, to: str, as_class: bool = False, as_text: bool = False) -> LinkCell:
+        return LinkCell(text, to=to, as_class=as_class, as_text=as_text)
 
     @staticmethod
     def create_external_link(
@@ -259,31 +377,93 @@ class DocumentCell:
         to_vk: bool = False,
         to_email: bool = False,
         to_slack: bool = False,
-    ) -> DocumentCell:
+    ) -> ExternalLinkCell:
         global APP_CONFIG
 
         if not APP_CONFIG.ignore_compromised:
             ...  # TODO: check
 
-        return DocumentCell(
-            raw_content=text,
-            additional_content={
-                "to": to,
-                "as_class": as_class,
-                "as_text": as_text,
-                "to_twitter": to_twitter,
-                "to_meta": to_meta,
-                "to_github": to_github,
-                "to_gitlab": to_gitlab,
-                "to_vk": to_vk,
-                "to_email": to_email,
-                "to_slack": to_slack,
-            },
-            type=DocumentCellType.link_external,
+        return ExternalLinkCell(
+            text,
+            to=to,
+            as_class=as_class,
+            as_text=as_text,
+            to_twitter=to_twitter,
+            to_meta=to_meta,
+            to_github=to_github,
+            to_gitlab=to_gitlab,
+            to_vk=to_vk,
+            to_email=to_email,
+            to_slack=to_slack,
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class ParagraphCell(DocumentCell):
+    centralize: bool = field(default=False)
+
+
+@dataclass(slots=True)
+class LinkCell(DocumentCell):
+    to: str = field(default="")
+    as_class: bool = field(default=False)
+    as_text: bool = field(default=False)
+    type: DocumentCellType = field(default=DocumentCellType.link_text)
+
+    def __post_init__(self) -> None:
+        if self.to == "":
+            raise ValueError(self.to, self.id, "Links must contain target information!")
+
+
+@dataclass(slots=True)
+class ExternalLinkCell(LinkCell):
+    to_twitter: bool = field(default=False)
+    to_meta: bool = field(default=False)
+    to_github: bool = field(default=False)
+    to_gitlab: bool = field(default=False)
+    to_vk: bool = field(default=False)
+    to_email: bool = field(default=False)
+    to_slack: bool = field(default=False)
+    type: DocumentCellType = field(default=DocumentCellType.link_external)
+
+    def __post_init__(self) -> None:
+        global APP_CONFIG
+
+        if self.to == "":
+            raise ValueError(self.to, self.id, "Links must contain target information!")
+
+        if not self.to.startswith("https") and not APP_CONFIG.force_install:
+            raise ValueError(self.to, self.id, "External links must contain https schema")
+
+
+@dataclass(slots=True)
+class CodeCell(DocumentCell):
+    lang: str = field(default="")
+    type: DocumentCellType = field(default=DocumentCellType.code)
+
+
+@dataclass(slots=True)
+class ImageCell(DocumentCell):
+    src: str = field(default="")
+    type: DocumentCellType = field(default=DocumentCellType.image)
+
+    def __post_init__(self) -> None:
+        if self.src == "":
+            raise ValueError(self.src, self.id, "Images must contain link to source, at least network")
+
+
+@dataclass(slots=True)
+class FieldCell(DocumentCell):
+    name: str = field(default="")
+    label: str = field(default="")
+    type: DocumentCellType = field(default=DocumentCellType.field)
+
+    def __post_init__(self) -> None:
+        if self.name == "" or self.label == "":
+            raise ValueError(self.name, self.id, "Fields must contain name and text label")
+
+
+@dataclass(slots=True, eq=False)
 class Module:
     name: str
     language: str
@@ -311,7 +491,7 @@ def init_librarian():
 
     # Creating plugin directory
     try:
-        mkdir(join(APP_CONFIG.home_dir, "plugins"))
+        mkdir(APP_CONFIG.plugins_dir)
 
     except FileExistsError:
         ...
@@ -319,11 +499,32 @@ def init_librarian():
     # Loading data from configs
     data: dict = {}
     try:
-        with open(join(APP_CONFIG.home_dir, "resources.toml"), "r") as file:
+        mtime = stat(APP_CONFIG.resources_toml).st_mtime
+
+        # Parsed TOML is cached next to the source, keyed by it's mtime, so
+        # repeated invocations pay a single stat + small pickle read. A cache
+        # that fails to load for any reason is just a miss, never an error
+        try:
+            with open(APP_CONFIG.resources_cache, "rb") as file:
+                cached_mtime, data = pickle_load(file)
+                if cached_mtime == mtime:
+                    return data
+
+        except Exception:
+            ...
+
+        with open(APP_CONFIG.resources_toml, "rb") as file:
             data = toml_load(file)
 
+        # Written to the side and swapped in, a killed process can not leave
+        # a truncated cache behind
+        with open(APP_CONFIG.resources_cache + ".tmp", "wb") as file:
+            pickle_dump((mtime, data), file, protocol=HIGHEST_PROTOCOL)
+
+        replace(APP_CONFIG.resources_cache + ".tmp", APP_CONFIG.resources_cache)
+
     except FileNotFoundError:
-        with open(join(APP_CONFIG.home_dir, "resources.toml"), "x") as file:
+        with open(APP_CONFIG.resources_toml, "xb") as file:
             data = {"plugins": [], "translations": {"enabled": False}}
             toml_dump(data, file)
 
@@ -334,47 +535,64 @@ def load_module(path: str) -> Module:
     return Module(path, path, None)
 
 
+def _scan_for_readme(path: str):
+    """Yield every directory under path that holds a README.md.
+
+    Hand-rolled os.scandir traversal: only README.md membership per directory
+        is interesting here, so the file lists that os.walk materializes for
+        every directory are never built. Cache folders are not descended into.
+    """
+
+    has_readme = False
+    subdirs: List[str] = []
+    with scandir(path) as entries:
+        for entry in entries:
+            if entry.name == "README.md" and entry.is_file():
+                has_readme = True
+
+            elif (
+                entry.name not in _CACHE_SET
+                and not entry.name.endswith(_CACHE_SUFFIXES)
+                and entry.is_dir(follow_symlinks=False)
+            ):
+                subdirs.append(entry.path)
+
+    if has_readme:
+        yield path
+
+    for subdir in subdirs:
+        yield from _scan_for_readme(subdir)
+
+
 def load_project(path: str = getcwd()):
     """
     Loads all project from the provided path or from the current working
     directory.
     """
-    global CACHE_FOLDERS
 
     # Avoiding all problems with README md files
     if "README.md" not in listdir(path):
         raise ValueError(path, "Path no containing README.md")
 
-    positions: List[str] = []  # Will contain all pos where README/ProjectStart found
-    for dirpath, dirname, files in walk(path):
-
-        skip = False
-        for cache_folder in CACHE_FOLDERS:
-            if cache_folder in dirpath:
-                skip = True
-
-        if skip:
-            continue
-
-        if "README.md" in files:
-            positions.append(dirpath)
-
-    result: List[Module] = []
-    for module in positions:
-        result.append(load_module(module))
-
-    return result
+    # Every pos where README/ProjectStart found becomes a module directly,
+    # no intermediate append loop
+    return [Module(position, position, None) for position in _scan_for_readme(path)]
 
 
 # =================================== RUNTIME =============================== #
 
 
 class Vendor(object):
+    __slots__ = ("_name", "_version", "_is_secure", "_login_method", "_credentials")
+
     _name: str
     _version: str
     _is_secure: str
     _login_method: str
-    _credentials: dict = {"login": "", "password": "", "token": ""}
+    _credentials: dict
+
+    def __init__(self) -> None:
+        self._credentials = {"login": "", "password": "", "token": ""}
 
     @overload
     @abstractmethod
@@ -449,7 +667,11 @@ class LocalVendor(Vendor):
         0.0.1
     """
 
-    _locations: List[str] = []
+    __slots__ = ("_locations",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._locations: List[str] = []
 
     @final
     @overload
@@ -571,6 +793,39 @@ class Dependency:
         ...
 
 
+def _dump_callable(fn: Union[Callable, None]) -> str:
+    """Dump callable to importable path in `module:function` form.
+
+    Arguments:
+        fn (Callable): Callable to dump, None allowed for unset defaults
+
+    Return:
+        path (str): Qualified path of callable, empty string for None
+    """
+
+    if fn is None:
+        return ""
+
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+def _load_callable(path: str) -> Union[Callable, None]:
+    """Resolve callable back from it's `module:function` path.
+
+    Arguments:
+        path (str): Qualified path as produced by _dump_callable
+
+    Return:
+        fn (Callable): Imported callable, None for empty path
+    """
+
+    if path == "":
+        return None
+
+    module, name = path.split(":")
+    return getattr(import_module(module), name)
+
+
 @dataclass
 class LanguageSpecs:
 
@@ -583,23 +838,81 @@ class LanguageSpecs:
     vendors_API: List[Vendor] = field(default_factory=lambda: [])
 
     # Requirement to run
-    on_start: Callable[[str], None] = field(default_factory=lambda: None)
-    is_language: Callable[[List[str]], bool] = field(default_factory=lambda: False)
-    project_files_loaders: List[Callable[[str], Module]] = field(default_factory=lambda: None)
-    project_loader: Callable[[List[str]], Module] = field(default_factory=lambda: None)
+    on_start: Callable[[str], None] = field(default=None)
+    is_language: Callable[[List[str]], bool] = field(default=None)
+    project_files_loaders: List[Callable[[str], Module]] = field(default=None)
+    project_loader: Callable[[List[str]], Module] = field(default=None)
 
     # Callbacks
     parse_documentation: List[Callable[[str], str]] = field(default_factory=lambda: [])
     additional_files_loaded: List[Callable[[str], List[str]]] = field(default_factory=lambda: [])
-    project_files_data_loaders: List[Callable[[str], List[str]]] = field(default=lambda: [])
-    advanced_documentation_loaded: List[Callable[[Request], int]] = field(default=lambda: [])
+    project_files_data_loaders: List[Callable[[str], List[str]]] = field(default_factory=lambda: [])
+    advanced_documentation_loaded: List[Callable[[Request], int]] = field(default_factory=lambda: [])
 
     def __post_init__(self):
         # TODO: Emit file names
         # TODO: Append default docs parser
         # TODO: Verify amount of vendors API
         # TODO: Load defaults for every category
-        ...
+        self._name_lc = self.language_name.lower()
+
+    def to_manifest(self) -> dict:
+        """Dump specs to plain TOML-ready manifest dict.
+
+        Data fields are stored as-is, callables are stored as importable
+            `module:function` paths, so no code executes on load.
+
+        Return:
+            manifest (dict): Ready to dump manifest of the specs
+        """
+
+        return {
+            "language_name": self.language_name,
+            "file_extensions": self.file_extensions,
+            "comments": self.comments,
+            "is_docs_after_func": self.is_docs_after_func,
+            "project_files": self.project_files,
+            "callbacks": {
+                "on_start": _dump_callable(self.on_start),
+                "is_language": _dump_callable(self.is_language),
+                "project_loader": _dump_callable(self.project_loader),
+                "project_files_loaders": [_dump_callable(fn) for fn in self.project_files_loaders or []],
+                "parse_documentation": [_dump_callable(fn) for fn in self.parse_documentation or []],
+                "additional_files_loaded": [_dump_callable(fn) for fn in self.additional_files_loaded or []],
+                "project_files_data_loaders": [_dump_callable(fn) for fn in self.project_files_data_loaders or []],
+                "advanced_documentation_loaded": [
+                    _dump_callable(fn) for fn in self.advanced_documentation_loaded or []
+                ],
+            },
+        }
+
+    @staticmethod
+    def from_manifest(manifest: dict) -> LanguageSpecs:
+        """Restore specs from manifest dict, counterpart of to_manifest.
+
+        Arguments:
+            manifest (dict): Parsed manifest data
+
+        Return:
+            specs (LanguageSpecs): Ready to use language specs
+        """
+
+        callbacks = manifest["callbacks"]
+        return LanguageSpecs(
+            language_name=manifest["language_name"],
+            file_extensions=manifest["file_extensions"],
+            comments=manifest["comments"],
+            is_docs_after_func=manifest["is_docs_after_func"],
+            project_files=manifest["project_files"],
+            on_start=_load_callable(callbacks["on_start"]),
+            is_language=_load_callable(callbacks["is_language"]),
+            project_loader=_load_callable(callbacks["project_loader"]),
+            project_files_loaders=[_load_callable(path) for path in callbacks["project_files_loaders"]],
+            parse_documentation=[_load_callable(path) for path in callbacks["parse_documentation"]],
+            additional_files_loaded=[_load_callable(path) for path in callbacks["additional_files_loaded"]],
+            project_files_data_loaders=[_load_callable(path) for path in callbacks["project_files_data_loaders"]],
+            advanced_documentation_loaded=[_load_callable(path) for path in callbacks["advanced_documentation_loaded"]],
+        )
 
     def get_loader(self, project_file: str) -> Union[Callable[[str], Module], None]:
         if project_file not in self.project_files:
@@ -613,25 +926,38 @@ class LanguageSpecs:
         return self.project_loader(project_files)
 
 
-@singledispatch
-def add_plugin(plugin, verbose=False):
-    raise TypeError(type(plugin), "not supported")
+def _add_plugin_str(plugin: str, verbose: bool = False) -> None:
+    ...
 
 
-@add_plugin.register
-def _(plugin: str, verbose=False):
-    ...
+def _add_plugin_specs(plugin: LanguageSpecs, verbose: bool = False) -> None:
+    global APP_RESOURCES
+    APP_RESOURCES._invalidate_caches()
 
 
-@add_plugin.register
-def _(plugin: LanguageSpecs, verbose=False):
-    ...
+_ADDERS: dict[type, Callable] = {str: _add_plugin_str, LanguageSpecs: _add_plugin_specs}
+
+
+def add_plugin(plugin, verbose=False):
+    adder = _ADDERS.get(type(plugin))
+
+    if adder is None:
+        # Exact type miss, fall back to subclass lookup
+        for registered, handler in _ADDERS.items():
+            if isinstance(plugin, registered):
+                adder = handler
+                break
+
+        else:
+            raise TypeError(type(plugin), "not supported")
+
+    adder(plugin, verbose)
 
 
 # ===================================== CLI ================================= #
 @group
 @option("--verbose", help="Print help options", is_flag=True, default=False)
-@option("--home", help="Home of librarian, where all things", default=join(expanduser("~"), ".librarian"))
+@option("--home", help="Home of librarian, where all things", default=_DEFAULT_HOME)
 @option("-y", "--yes", is_flag=True, help="Agree to all prompts", default=False)
 @option("-f", "--force", is_flag=True, help="Force run of program even if something is not here", default=False)
 @option("--not-secure", is_flag=True, help="Ignore all security checks", default=False)
@@ -647,8 +973,6 @@ def cli(verbose, home, yes, force, not_secure):
 
     APP_RESOURCES = AppResources(raw_data)
 
-    init_librarian()
-
 
 @cli.group
 @argument("plugin", type=str)
@@ -713,6 +1037,11 @@ def serve(port: int, debug: bool):
     world. Or just use build-in options.
     """
 
+    # Flask and it's import tree (Werkzeug, Jinja2) load only when serving,
+    # all other commands never pay for them
+    from flask import Flask, render_template
+    from flask_cors import CORS
+
     server = Flask(__name__)
     CORS(server)
 
@@ -734,7 +1063,3 @@ doc.add_command(serve)
 
 if __name__ == "__main__":
     exit(cli())
-
-init_librarian()
-APP_CONFIG = AppConfig(expanduser("~"), False, False, False, False)
-APP_RESOURCES = AppResources(APP_CONFIG)